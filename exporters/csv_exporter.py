@@ -3,6 +3,7 @@
 import csv
 import io
 from datetime import datetime
+from operator import attrgetter
 
 from domain import Measurement, MeasurementPoint
 
@@ -82,7 +83,7 @@ def get_latest_measurement(
     """
     if not measurements:
         return None
-    return max(measurements, key=lambda m: m.timestamp)
+    return max(measurements, key=attrgetter("timestamp"))
 
 
 def build_export_row(
@@ -1,12 +1,21 @@
 """Streamlit GUI for water quality visualization."""
 
+import hashlib
 import io
-import tempfile
+import re
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import matplotlib
+
+# Plots are built without pyplot, but st.pyplot still imports it; keep
+# it from picking a GUI backend on the server.
+matplotlib.use("Agg")
+
 import streamlit as st
+from matplotlib.figure import Figure
 
 from exporters import (
     build_error_csv,
@@ -17,9 +26,59 @@ from exporters import (
     write_csv,
 )
 from providers import ExcelProvider
-from providers.exceptions import InvalidFileStructureError
+from providers.exceptions import DataProviderError, InvalidFileStructureError
 from visualization import plot_chemical_parameters, plot_water_quality
 
+BATCH_MAX_WORKERS = 8
+BATCH_PROVIDER_CACHE_SIZE = 32
+BATCH_PLOT_DPI = 100
+
+# Characters other than letters, digits, space, '-' and '_'
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+
+
+def _content_hash(data: bytes) -> str:
+    """Return a short hex digest identifying file contents."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _load_provider(
+    file_hash: str, _data: bytes
+) -> tuple[ExcelProvider, dict[str, str]]:
+    """
+    Build a fully loaded provider for uploaded file contents.
+
+    The result is cached by Streamlit on ``file_hash``, so reruns
+    triggered by widget interaction do not parse the workbook again.
+    The leading underscore keeps Streamlit from hashing the raw bytes.
+    Errors of single measurement sheets are collected per point, so
+    the remaining points can still be shown.
+
+    Parameters
+    ----------
+    file_hash : str
+        Digest of the file contents, see ``_content_hash``.
+    _data : bytes
+        Raw contents of the uploaded Excel file.
+
+    Returns
+    -------
+    tuple[ExcelProvider, dict[str, str]]
+        Provider with all points and readable measurements already
+        loaded, and error messages keyed by id of points whose
+        measurements could not be read.
+    """
+    errors: dict[str, str] = {}
+    with ExcelProvider(io.BytesIO(_data)) as provider:
+        for point in provider.list_points():
+            try:
+                provider.list_measurements(point.id)
+            except DataProviderError as e:
+                errors[point.id] = str(e)
+
+    return provider, errors
+
 
 def render_single_file_mode() -> None:
     """Render single file upload and visualization mode."""
@@ -32,14 +91,9 @@ def render_single_file_mode() -> None:
         st.info("Zaladuj plik Excel, aby rozpoczac.")
         return
 
-    with tempfile.NamedTemporaryFile(
-        delete=False, suffix=Path(uploaded_file.name).suffix
-    ) as tmp:
-        tmp.write(uploaded_file.getvalue())
-        tmp_path = tmp.name
-
     try:
-        provider = ExcelProvider(tmp_path)
+        data = uploaded_file.getvalue()
+        provider, point_errors = _load_provider(_content_hash(data), data)
         points = provider.list_points()
 
         if not points:
@@ -56,6 +110,10 @@ def render_single_file_mode() -> None:
             return
 
         point_id = point_options[selected_label]
+        if point_id in point_errors:
+            st.error(point_errors[point_id])
+            return
+
         measurements = provider.list_measurements(point_id)
 
         if not measurements:
@@ -64,7 +122,7 @@ def render_single_file_mode() -> None:
 
         st.success(f"Zaladowano {len(measurements)} pomiarow.")
 
-        point = next(p for p in points if p.id == point_id)
+        point = provider.get_point(point_id)
 
         st.subheader("Parametry fizykochemiczne")
         title1 = f"Zmiennosc parametrow fizykochemicznych - {point.name}"
@@ -82,6 +140,9 @@ def render_single_file_mode() -> None:
 
         measurements_by_point: dict[str, list] = {}
         for p in points:
+            if p.id in point_errors:
+                st.error(f"Pominieto punkt {p.name}: {point_errors[p.id]}")
+                continue
             p_measurements = provider.list_measurements(p.id)
             if p_measurements:
                 measurements_by_point[p.id] = p_measurements
@@ -118,9 +179,6 @@ def render_single_file_mode() -> None:
     except Exception as e:
         st.error(f"Nieoczekiwany blad: {e}")
 
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
-
 
 def _pick_folder() -> None:
     """Open a native folder picker dialog and store the result in session state."""
@@ -153,6 +211,125 @@ def _clean_path(raw: str) -> str:
     return cleaned
 
 
+def _provider_for(excel_path: Path) -> ExcelProvider:
+    """
+    Return a provider for a batch file, reusing one for unchanged contents.
+
+    Providers are kept in session state under the file path and a hash
+    of its contents, so regenerating plots skips parsing files that did
+    not change. The cache holds at most ``BATCH_PROVIDER_CACHE_SIZE``
+    entries, evicting the least recently used.
+
+    Parameters
+    ----------
+    excel_path : Path
+        Path to the Excel file.
+
+    Returns
+    -------
+    ExcelProvider
+        Cached or newly created provider for the file.
+    """
+    try:
+        data = excel_path.read_bytes()
+    except OSError:
+        # Let the provider report the error when the file is processed
+        return ExcelProvider(str(excel_path))
+
+    key = (str(excel_path), _content_hash(data))
+    cache = st.session_state.setdefault("_batch_providers", OrderedDict())
+
+    provider = cache.get(key)
+    if provider is not None:
+        cache.move_to_end(key)
+        return provider
+
+    provider = ExcelProvider(io.BytesIO(data))
+    cache[key] = provider
+    if len(cache) > BATCH_PROVIDER_CACHE_SIZE:
+        cache.popitem(last=False)
+    return provider
+
+
+def _process_file(
+    excel_path: Path,
+    provider: ExcelProvider,
+) -> tuple[list[tuple[str, bytes]], list[dict[str, str]], list[DataProviderError]]:
+    """
+    Generate plots and CSV export rows for all points in one Excel file.
+
+    Runs in a worker thread, so it must not call Streamlit. Points whose
+    measurements cannot be read are skipped and their errors returned,
+    so the remaining points are still processed.
+
+    Parameters
+    ----------
+    excel_path : Path
+        Path to the Excel file.
+    provider : ExcelProvider
+        Provider reading the file.
+
+    Returns
+    -------
+    tuple[list[tuple[str, bytes]], list[dict[str, str]], list[DataProviderError]]
+        PNG images as ``(filename, png_bytes)`` pairs, export rows with
+        the latest measurement of each point and errors of skipped
+        points.
+    """
+    file_prefix = excel_path.stem
+    images: list[tuple[str, bytes]] = []
+    export_rows: list[dict[str, str]] = []
+    point_errors: list[DataProviderError] = []
+
+    # Read everything up front so the workbook is released before rendering
+    point_measurements = []
+    with provider:
+        for point in provider.list_points():
+            try:
+                point_measurements.append(
+                    (point, provider.list_measurements(point.id))
+                )
+            except DataProviderError as e:
+                point_errors.append(e)
+
+    # One figure per plot type, cleared and redrawn for every point
+    fig1 = Figure(figsize=(14, 6))
+    fig2 = Figure(figsize=(14, 6))
+    for point, measurements in point_measurements:
+        if not measurements:
+            continue
+
+        # Collect CSV export row
+        latest = get_latest_measurement(measurements)
+        if latest:
+            export_rows.append(build_export_row(point, latest))
+
+        # Sanitize point name for filename
+        safe_name = _UNSAFE_FILENAME_CHARS.sub("_", point.name).strip()
+
+        # Generate physicochemical plot
+        title1 = f"Zmiennosc parametrow fizykochemicznych - {point.name}"
+        plot_water_quality(measurements, title=title1, fig=fig1)
+
+        img_buffer1 = io.BytesIO()
+        fig1.savefig(img_buffer1, format="png", dpi=BATCH_PLOT_DPI)
+        images.append(
+            (f"{file_prefix}_{safe_name}_fizykochemiczne.png", img_buffer1.getvalue())
+        )
+
+        # Generate chemical plot
+        title2 = f"Stezenia zwiazkow chemicznych - {point.name}"
+        plot_chemical_parameters(measurements, title=title2, fig=fig2)
+
+        img_buffer2 = io.BytesIO()
+        fig2.savefig(img_buffer2, format="png", dpi=BATCH_PLOT_DPI)
+        images.append(
+            (f"{file_prefix}_{safe_name}_chemiczne.png", img_buffer2.getvalue())
+        )
+
+    return images, export_rows, point_errors
+
+
 def render_batch_mode() -> None:
     """Render batch processing mode for generating plots from a folder."""
     st.markdown(
@@ -213,57 +390,33 @@ def render_batch_mode() -> None:
         all_export_rows: list[dict[str, str]] = []
         csv_errors: list[dict[str, str]] = []
 
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            for i, excel_path in enumerate(excel_files):
-                status_text.text(f"Przetwarzanie: {excel_path.name}")
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(_process_file, excel_path, _provider_for(excel_path))
+                for excel_path in excel_files
+            ]
+            paths = dict(zip(futures, excel_files))
 
-                try:
-                    file_prefix = excel_path.stem
-                    provider = ExcelProvider(str(excel_path))
-                    points = provider.list_points()
-
-                    for point in points:
-                        measurements = provider.list_measurements(point.id)
-
-                        if not measurements:
-                            continue
-
-                        # Collect CSV export row
-                        latest = get_latest_measurement(measurements)
-                        if latest:
-                            all_export_rows.append(
-                                build_export_row(point, latest)
-                            )
-
-                        # Sanitize point name for filename
-                        safe_name = "".join(
-                            c if c.isalnum() or c in (" ", "-", "_") else "_"
-                            for c in point.name
-                        ).strip()
-
-                        # Generate physicochemical plot
-                        title1 = f"Zmiennosc parametrow fizykochemicznych - {point.name}"
-                        fig1 = plot_water_quality(measurements, title=title1)
-
-                        img_buffer1 = io.BytesIO()
-                        fig1.savefig(img_buffer1, format="png", dpi=150, bbox_inches="tight")
-                        img_buffer1.seek(0)
-                        zip_file.writestr(f"{file_prefix}_{safe_name}_fizykochemiczne.png", img_buffer1.read())
-                        plt.close(fig1)
-                        total_plots += 1
-
-                        # Generate chemical plot
-                        title2 = f"Stezenia zwiazkow chemicznych - {point.name}"
-                        fig2 = plot_chemical_parameters(measurements, title=title2)
-
-                        img_buffer2 = io.BytesIO()
-                        fig2.savefig(img_buffer2, format="png", dpi=150, bbox_inches="tight")
-                        img_buffer2.seek(0)
-                        zip_file.writestr(f"{file_prefix}_{safe_name}_chemiczne.png", img_buffer2.read())
-                        plt.close(fig2)
-                        total_plots += 1
+            for i, future in enumerate(as_completed(futures)):
+                status_text.text(f"Przetworzono: {paths[future].name}")
+                progress_bar.progress((i + 1) / len(excel_files))
 
+        # Collect results in file order, so the output does not depend on
+        # which thread finished first; PNG data is already deflated, so
+        # entries are stored as-is
+        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_STORED) as zip_file:
+            for excel_path, future in zip(excel_files, futures):
+                try:
+                    images, export_rows, file_errors = future.result()
                 except Exception as e:
+                    images, export_rows, file_errors = [], [], [e]
+
+                for filename, png_bytes in images:
+                    zip_file.writestr(filename, png_bytes)
+                total_plots += len(images)
+                all_export_rows.extend(export_rows)
+
+                for e in file_errors:
                     errors.append(f"{excel_path.name}: {e}")
                     csv_errors.append({
                         "filename": excel_path.name,
@@ -271,8 +424,6 @@ def render_batch_mode() -> None:
                         "error_message": str(e),
                     })
 
-                progress_bar.progress((i + 1) / len(excel_files))
-
         status_text.empty()
         progress_bar.empty()
 
@@ -24,6 +24,22 @@ class DataProvider(Protocol):
         """
         ...
 
+    def get_point(self, point_id: str) -> MeasurementPoint | None:
+        """
+        Get a single measurement point by its identifier.
+
+        Parameters
+        ----------
+        point_id : str
+            Identifier of the measurement point.
+
+        Returns
+        -------
+        MeasurementPoint | None
+            The measurement point, or None if it does not exist.
+        """
+        ...
+
     def list_measurements(self, point_id: str) -> list[Measurement]:
         """
         List all measurements for a given point.
@@ -1,14 +1,20 @@
 """Excel data provider for water quality measurements."""
 
-from datetime import datetime, time, date
-from typing import Any
+from datetime import datetime, time, date, timedelta
+from pathlib import Path
+from typing import Any, BinaryIO
 
 import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 
 from domain import Measurement, MeasurementPoint
 from providers.exceptions import InvalidFileStructureError
 from providers.parsers import parse_coordinates, parse_numeric_value
 
+# Day zero of Excel serial dates (1900 date system)
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+
 
 class ExcelProvider:
     """
@@ -18,10 +24,14 @@ class ExcelProvider:
     all measurement points. Each measurement point must have
     a corresponding sheet with the same name containing measurement data.
 
+    The workbook is opened once, on first access, and shared by all
+    reads. Use ``close()`` or a ``with`` block to release it; data that
+    was already parsed stays available afterwards.
+
     Parameters
     ----------
-    path : str
-        Path to the Excel file.
+    source : str | Path | BinaryIO
+        Path to the Excel file or a binary file-like object with its contents.
     """
 
     POINTS_SHEET = "Punkty"
@@ -57,17 +67,24 @@ class ExcelProvider:
         "conductivity": {"index": 23, "unit": "µS/cm"},
     }
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, source: str | Path | BinaryIO) -> None:
         """
         Initialize the Excel provider.
 
         Parameters
         ----------
-        path : str
-            Path to the Excel file.
+        source : str | Path | BinaryIO
+            Path to the Excel file or a binary file-like object
+            (e.g. ``io.BytesIO``) with its contents.
         """
-        self._path = path
+        self._source = source
+        self._wb: Workbook | None = None
         self._points: dict[str, MeasurementPoint] | None = None
+        self._measurements: dict[str, list[Measurement]] = {}
+        self._param_indices: list[tuple[str, int, str]] = [
+            (name, config["index"], config["unit"])
+            for name, config in self.PARAMETERS.items()
+        ]
 
     def list_points(self) -> list[MeasurementPoint]:
         """
@@ -82,10 +99,31 @@ class ExcelProvider:
             self._load_points()
         return list(self._points.values())
 
+    def get_point(self, point_id: str) -> MeasurementPoint | None:
+        """
+        Get a single measurement point by its identifier.
+
+        Parameters
+        ----------
+        point_id : str
+            Identifier of the measurement point.
+
+        Returns
+        -------
+        MeasurementPoint | None
+            The measurement point, or None if it does not exist.
+        """
+        if self._points is None:
+            self._load_points()
+        return self._points.get(point_id)
+
     def list_measurements(self, point_id: str) -> list[Measurement]:
         """
         List all measurements for a given point.
 
+        Parsed measurements are cached per point, so repeated calls
+        do not read the sheet again.
+
         Parameters
         ----------
         point_id : str
@@ -96,6 +134,10 @@ class ExcelProvider:
         list[Measurement]
             List of measurements for the specified point.
         """
+        cached = self._measurements.get(point_id)
+        if cached is not None:
+            return list(cached)
+
         if self._points is None:
             self._load_points()
 
@@ -103,19 +145,47 @@ class ExcelProvider:
         if point is None:
             return []
 
-        return self._load_measurements(point)
-
-    def _validate_points_sheet(self, xls: pd.ExcelFile) -> None:
-        """Validate that the 'Punkty' sheet exists and has required columns."""
-        if self.POINTS_SHEET not in xls.sheet_names:
+        measurements = self._load_measurements(point)
+        self._measurements[point_id] = measurements
+        return list(measurements)
+
+    def close(self) -> None:
+        """Release the underlying workbook handle, if open."""
+        if self._wb is not None:
+            self._wb.close()
+            self._wb = None
+
+    def __enter__(self) -> "ExcelProvider":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Guard against partially initialized instances
+        if getattr(self, "_wb", None) is not None:
+            self.close()
+
+    def _workbook(self) -> Workbook:
+        """Return the workbook opened in read-only mode, opening it lazily."""
+        if self._wb is None:
+            self._wb = load_workbook(self._source, read_only=True, data_only=True)
+        return self._wb
+
+    def _get_sheet(self, sheet_name: str) -> ReadOnlyWorksheet:
+        """Return a worksheet by name, raising if it does not exist."""
+        wb = self._workbook()
+        if sheet_name not in wb.sheetnames:
             raise InvalidFileStructureError(
-                f"Brak arkusza '{self.POINTS_SHEET}' w pliku. "
-                f"Dostepne arkusze: {xls.sheet_names}"
+                f"Brak arkusza '{sheet_name}' w pliku. "
+                f"Dostepne arkusze: {wb.sheetnames}"
             )
+        return wb[sheet_name]
 
-        df = pd.read_excel(xls, sheet_name=self.POINTS_SHEET, nrows=0)
+    def _validate_points_header(self, header: dict[str, int]) -> None:
+        """Validate that the 'Punkty' sheet header has required columns."""
         required = {self.COL_NAME, self.COL_CODE}
-        missing = required - set(df.columns)
+        missing = required - set(header)
         if missing:
             raise InvalidFileStructureError(
                 f"Brak wymaganych kolumn w arkuszu '{self.POINTS_SHEET}': "
@@ -123,58 +193,69 @@ class ExcelProvider:
             )
 
     def _validate_measurement_sheet(
-        self, xls: pd.ExcelFile, sheet_name: str
+        self, ws: ReadOnlyWorksheet, sheet_name: str
     ) -> None:
-        """Validate that a measurement sheet exists and has enough columns."""
-        if sheet_name not in xls.sheet_names:
-            raise InvalidFileStructureError(
-                f"Brak arkusza '{sheet_name}' w pliku. "
-                f"Dostepne arkusze: {xls.sheet_names}"
-            )
-
-        df = pd.read_excel(
-            xls,
-            sheet_name=sheet_name,
-            header=None,
-            skiprows=self.MEASUREMENTS_START_ROW,
-            nrows=1,
+        """Validate that a measurement sheet has enough columns."""
+        n_columns = max(
+            (
+                _trimmed_length(row)
+                for row in ws.iter_rows(
+                    max_row=self.MEASUREMENTS_START_ROW + 1,
+                    max_col=self.MIN_MEASUREMENT_COLUMNS,
+                    values_only=True,
+                )
+            ),
+            default=0,
         )
-        if len(df.columns) < self.MIN_MEASUREMENT_COLUMNS:
+        if n_columns < self.MIN_MEASUREMENT_COLUMNS:
             raise InvalidFileStructureError(
-                f"Arkusz '{sheet_name}' ma {len(df.columns)} kolumn, "
+                f"Arkusz '{sheet_name}' ma {n_columns} kolumn, "
                 f"wymagane minimum {self.MIN_MEASUREMENT_COLUMNS}."
             )
 
     def _load_points(self) -> None:
         """Load measurement points from the Excel file."""
-        xls = pd.ExcelFile(self._path)
-        self._validate_points_sheet(xls)
-        df = pd.read_excel(xls, sheet_name=self.POINTS_SHEET)
+        ws = self._get_sheet(self.POINTS_SHEET)
+        header_row = next(ws.iter_rows(max_row=1, values_only=True), ())
+        header = {
+            name: idx
+            for idx, name in enumerate(header_row)
+            if name is not None
+        }
+        self._validate_points_header(header)
         self._points = {}
 
-        for _, row in df.iterrows():
+        def cell(row: tuple, column: str) -> Any:
+            idx = header.get(column)
+            return None if idx is None else row[idx]
+
+        # Rows are padded or cut to the header width
+        for row in ws.iter_rows(
+            min_row=2, max_col=_trimmed_length(header_row), values_only=True
+        ):
+            raw_name = cell(row, self.COL_NAME)
             # Skip rows with empty point name
-            if pd.isna(row[self.COL_NAME]) or str(row[self.COL_NAME]).strip() == "":
+            if raw_name is None or str(raw_name).strip() == "":
                 continue
 
-            lat, lon = parse_coordinates(row[self.COL_COORDS])
+            lat, lon = parse_coordinates(cell(row, self.COL_COORDS))
 
-            name = str(row[self.COL_NAME]).strip()
-            code = row[self.COL_CODE]
-            point_id = name if pd.isna(code) else str(code).strip()
+            name = str(raw_name).strip()
+            code = cell(row, self.COL_CODE)
+            point_id = name if code is None else str(code).strip()
 
             point = MeasurementPoint(
                 id=point_id,
                 name=name,
                 metadata={
-                    "river_name": str(row[self.COL_RIVER]).strip(),
-                    "jcwp_code": str(row[self.COL_JCWP]).strip(),
-                    "catchment_authority": str(row[self.COL_CATCHMENT]).strip(),
-                    "rzgw": str(row[self.COL_RZGW]).strip(),
-                    "location_description": str(row[self.COL_LOCATION]).strip(),
-                    "surroundings": str(row[self.COL_SURROUNDINGS]).strip(),
-                    "investigator": str(row[self.COL_INVESTIGATOR]).strip(),
-                    "contact": str(row[self.COL_CONTACT]).strip(),
+                    "river_name": _text(cell(row, self.COL_RIVER)),
+                    "jcwp_code": _text(cell(row, self.COL_JCWP)),
+                    "catchment_authority": _text(cell(row, self.COL_CATCHMENT)),
+                    "rzgw": _text(cell(row, self.COL_RZGW)),
+                    "location_description": _text(cell(row, self.COL_LOCATION)),
+                    "surroundings": _text(cell(row, self.COL_SURROUNDINGS)),
+                    "investigator": _text(cell(row, self.COL_INVESTIGATOR)),
+                    "contact": _text(cell(row, self.COL_CONTACT)),
                     "latitude": lat,
                     "longitude": lon,
                 },
@@ -184,37 +265,48 @@ class ExcelProvider:
 
     def _load_measurements(self, point: MeasurementPoint) -> list[Measurement]:
         """Load measurements for a specific point."""
-        xls = pd.ExcelFile(self._path)
-        self._validate_measurement_sheet(xls, point.name)
-        df = pd.read_excel(
-            xls,
-            sheet_name=point.name,
-            header=None,
-            skiprows=self.MEASUREMENTS_START_ROW,
-        )
-
-        measurements: list[Measurement] = []
-
-        for _, row in df.iterrows():
-            if pd.isna(row.iloc[0]):
-                continue
-
-            measurement = self._parse_measurement_row(row, point.id)
-            if measurement is not None:
-                measurements.append(measurement)
-
-        return measurements
+        ws = self._get_sheet(point.name)
+        self._validate_measurement_sheet(ws, point.name)
+
+        # Only the first MIN_MEASUREMENT_COLUMNS columns are used; bounding
+        # max_col skips stray trailing cells and pads short rows.
+        # Rows without a date or without any parameter value (e.g. dates
+        # filled in ahead of planned sampling) are skipped.
+        rows = [
+            row
+            for row in ws.iter_rows(
+                min_row=self.MEASUREMENTS_START_ROW + 1,
+                max_col=self.MIN_MEASUREMENT_COLUMNS,
+                values_only=True,
+            )
+            if row[0] is not None and self._has_parameter_values(row)
+        ]
+
+        # Convert date and time columns in one pass per sheet
+        dates = self._parse_dates([row[0] for row in rows])
+        times = self._parse_times([row[1] for row in rows])
+
+        return [
+            self._parse_measurement_row(row, point.id, sample_date, sample_time)
+            for row, sample_date, sample_time in zip(rows, dates, times)
+            if sample_date is not None
+        ]
+
+    def _has_parameter_values(self, row: tuple) -> bool:
+        """Check if any parameter cell in the row is filled."""
+        for _, index, _ in self._param_indices:
+            if row[index] is not None:
+                return True
+        return False
 
     def _parse_measurement_row(
-        self, row: pd.Series, point_id: str
-    ) -> Measurement | None:
+        self,
+        row: tuple,
+        point_id: str,
+        sample_date: date,
+        sample_time: time | None,
+    ) -> Measurement:
         """Parse a single Excel row into a Measurement object."""
-        sample_date = self._parse_date(row.iloc[0])
-        if sample_date is None:
-            return None
-
-        sample_time = self._parse_time(row.iloc[1])
-
         timestamp = datetime.combine(
             sample_date, sample_time or datetime.min.time()
         )
@@ -231,71 +323,117 @@ class ExcelProvider:
             metadata=metadata,
         )
 
-    def _extract_metadata(self, row: pd.Series) -> dict[str, Any]:
+    def _extract_metadata(self, row: tuple) -> dict[str, Any]:
         """Extract metadata from a measurement row."""
         return {
-            "sampling_location": row.iloc[2],
-            "depth_info": row.iloc[3],
-            "sample_volume_l": row.iloc[4],
-            "water_state": row.iloc[5],
-            "water_gauge_state": row.iloc[6],
-            "precipitation_mm": row.iloc[7],
-            "precipitation_description": row.iloc[8],
-            "anomalies": row.iloc[9],
-            "field_test_time": row.iloc[10],
-            "home_test_date": row.iloc[14],
-            "home_test_time": row.iloc[15],
-            "calibration_date": row.iloc[24],
-            "remarks": row.iloc[25],
+            "sampling_location": row[2],
+            "depth_info": row[3],
+            "sample_volume_l": row[4],
+            "water_state": row[5],
+            "water_gauge_state": row[6],
+            "precipitation_mm": row[7],
+            "precipitation_description": row[8],
+            "anomalies": row[9],
+            "field_test_time": row[10],
+            "home_test_date": row[14],
+            "home_test_time": row[15],
+            "calibration_date": row[24],
+            "remarks": row[25],
         }
 
     def _extract_parameters(
-        self, row: pd.Series
+        self, row: tuple
     ) -> tuple[dict[str, float | None], dict[str, str | None], dict[str, str]]:
         """Extract numeric parameters, flags, and units from a row."""
         parameters: dict[str, float | None] = {}
         flags: dict[str, str | None] = {}
         units: dict[str, str] = {}
 
-        for name, config in self.PARAMETERS.items():
-            value, flag = parse_numeric_value(row.iloc[config["index"]])
+        for name, index, unit in self._param_indices:
+            value, flag = parse_numeric_value(row[index])
             if value is not None:
                 parameters[name] = value
-                units[name] = config["unit"]
+                units[name] = unit
             if flag is not None:
                 flags[name] = flag
 
         return parameters, flags, units
 
     @staticmethod
-    def _parse_date(value) -> date | None:
-        """Parse date from Excel cell."""
-        try:
-            return pd.to_datetime(value).date()
-        except Exception:
-            return None
+    def _parse_dates(values: list[Any]) -> list[date | None]:
+        """Parse a column of date cells, converting text cells in bulk."""
+        dates: list[date | None] = [None] * len(values)
+        text_indices: list[int] = []
+
+        for i, value in enumerate(values):
+            if isinstance(value, datetime):
+                dates[i] = value.date()
+            elif isinstance(value, date):
+                dates[i] = value
+            elif isinstance(value, (int, float)):
+                serial = _from_excel_serial(value)
+                dates[i] = serial.date() if serial is not None else None
+            elif isinstance(value, str):
+                text_indices.append(i)
+
+        for i, parsed in zip(
+            text_indices, _parse_datetime_strings([values[i] for i in text_indices])
+        ):
+            dates[i] = parsed.date() if parsed is not None else None
+
+        return dates
 
     @staticmethod
-    def _parse_time(value) -> time | None:
-        """Parse time from Excel cell."""
-        if value is None or pd.isna(value):
-            return None
-
-        if isinstance(value, time):
-            return value
-
-        if isinstance(value, pd.Timestamp):
-            return value.time()
-
-        if isinstance(value, (float, int)):
-            try:
-                return (
-                    pd.Timestamp("1899-12-30") + pd.to_timedelta(value, unit="D")
-                ).time()
-            except Exception:
-                return None
-
-        try:
-            return pd.to_datetime(value).time()
-        except Exception:
-            return None
+    def _parse_times(values: list[Any]) -> list[time | None]:
+        """Parse a column of time cells, converting text cells in bulk."""
+        times: list[time | None] = [None] * len(values)
+        text_indices: list[int] = []
+
+        for i, value in enumerate(values):
+            if isinstance(value, time):
+                times[i] = value
+            elif isinstance(value, datetime):
+                times[i] = value.time()
+            elif isinstance(value, (int, float)):
+                serial = _from_excel_serial(value)
+                times[i] = serial.time() if serial is not None else None
+            elif isinstance(value, str):
+                text_indices.append(i)
+
+        for i, parsed in zip(
+            text_indices, _parse_datetime_strings([values[i] for i in text_indices])
+        ):
+            times[i] = parsed.time() if parsed is not None else None
+
+        return times
+
+
+def _from_excel_serial(value: float) -> datetime | None:
+    """Convert an Excel serial day number to datetime."""
+    try:
+        return _EXCEL_EPOCH + timedelta(days=value)
+    except (OverflowError, ValueError):
+        return None
+
+
+def _parse_datetime_strings(values: list[str]) -> list[datetime | None]:
+    """Parse date/time strings with a single pandas call."""
+    if not values:
+        return []
+    parsed = pd.to_datetime(pd.Series(values), errors="coerce", format="mixed")
+    return [None if pd.isna(ts) else ts.to_pydatetime() for ts in parsed]
+
+
+def _trimmed_length(row: tuple) -> int:
+    """Return the row length without trailing empty cells."""
+    n = len(row)
+    while n and row[n - 1] is None:
+        n -= 1
+    return n
+
+
+def _text(value: Any) -> str:
+    """Convert a cell value to stripped text, mapping empty cells to ''."""
+    if value is None:
+        return ""
+    return str(value).strip()
@@ -98,6 +98,13 @@ def parse_numeric_value(value) -> tuple[Optional[float], Optional[str]]:
     if value is None:
         return None, None
 
+    # Exact type checks before isinstance: cells are mostly plain numbers
+    value_type = type(value)
+    if value_type is float:
+        return value, None
+    if value_type is int:
+        return float(value), None
+
     if isinstance(value, (int, float)):
         return float(value), None
 
@@ -109,11 +116,8 @@ def parse_numeric_value(value) -> tuple[Optional[float], Optional[str]]:
         return None, None
 
     flag = None
-    if text.startswith("<"):
-        flag = "<"
-        text = text[1:]
-    elif text.startswith(">"):
-        flag = ">"
+    if text[0] in "<>":
+        flag = text[0]
         text = text[1:]
 
     try:
@@ -37,6 +37,12 @@ class TestMeasurementPoint:
         with pytest.raises(Exception):
             point.id = "P002"
 
+    def test_measurement_point_has_no_instance_dict(self):
+        """Test that MeasurementPoint uses slots instead of __dict__."""
+        point = MeasurementPoint(id="P001", name="Test Point")
+
+        assert not hasattr(point, "__dict__")
+
 
 class TestMeasurement:
     """Tests for Measurement class."""
@@ -91,3 +97,12 @@ class TestMeasurement:
 
         assert measurement.parameters["water_temperature"] == 15.5
         assert measurement.parameters["pH"] is None
+
+    def test_measurement_has_no_instance_dict(self):
+        """Test that Measurement uses slots instead of __dict__."""
+        measurement = Measurement(
+            point_id="P001",
+            timestamp=datetime(2024, 1, 15, 10, 30),
+        )
+
+        assert not hasattr(measurement, "__dict__")
@@ -0,0 +1,253 @@
+"""Tests for reading measurement data with ExcelProvider."""
+
+import io
+import tempfile
+from datetime import datetime, time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from providers.excel import ExcelProvider
+
+POINTS_HEADERS = [
+    "Nazwa punktu", "Kod punktu", "Współrzędne punktu",
+    "Nazwa rzeki", "Kod JCWP", "Zarząd zlewni", "RZGW",
+    "Opis lokalizacji", "Otoczenie", "Osoba badająca", "Kontakt",
+]
+
+
+def _measurement_row(
+    sample_date, sample_time=None, **values
+) -> list:
+    """Build a 26-column measurement row with parameters set by name."""
+    row = [None] * ExcelProvider.MIN_MEASUREMENT_COLUMNS
+    row[0] = sample_date
+    row[1] = sample_time
+    for name, value in values.items():
+        row[ExcelProvider.PARAMETERS[name]["index"]] = value
+    return row
+
+
+def _build_workbook(rows: list[list]) -> Workbook:
+    """Create a workbook with one point 'Punkt_1' and given measurement rows."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Punkty"
+    ws.append(POINTS_HEADERS)
+    ws.append(["Punkt_1", "P1", "52,2297 21,0122", "Wisla", None, "Z1", "R1",
+               "Lokalizacja", "Las", "Jan", "jan@example.com"])
+
+    sheet = wb.create_sheet(title="Punkt_1")
+    for _ in range(ExcelProvider.MEASUREMENTS_START_ROW):
+        sheet.append(["naglowek"] * ExcelProvider.MIN_MEASUREMENT_COLUMNS)
+    for row in rows:
+        sheet.append(row)
+    return wb
+
+
+@pytest.fixture()
+def workbook_path():
+    """Save a workbook to a temporary file and remove it after the test."""
+    paths: list[str] = []
+
+    def _save(wb: Workbook) -> str:
+        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx")
+        wb.save(tmp.name)
+        tmp.close()
+        paths.append(tmp.name)
+        return tmp.name
+
+    yield _save
+    for p in paths:
+        Path(p).unlink(missing_ok=True)
+
+
+class TestListPoints:
+    """Tests for reading the 'Punkty' sheet."""
+
+    def test_point_fields(self, workbook_path):
+        """Point id, name, metadata and coordinates are read from the sheet."""
+        provider = ExcelProvider(workbook_path(_build_workbook([])))
+        points = provider.list_points()
+        provider.close()
+
+        assert len(points) == 1
+        point = points[0]
+        assert point.id == "P1"
+        assert point.name == "Punkt_1"
+        assert point.metadata["river_name"] == "Wisla"
+        assert point.metadata["latitude"] == pytest.approx(52.2297)
+        assert point.metadata["longitude"] == pytest.approx(21.0122)
+
+    def test_empty_cell_metadata_is_empty_string(self, workbook_path):
+        """Empty metadata cells are mapped to empty strings."""
+        provider = ExcelProvider(workbook_path(_build_workbook([])))
+        point = provider.list_points()[0]
+        provider.close()
+
+        assert point.metadata["jcwp_code"] == ""
+
+    def test_get_point(self, workbook_path):
+        """A point is looked up by id; unknown ids give None."""
+        provider = ExcelProvider(workbook_path(_build_workbook([])))
+
+        assert provider.get_point("P1").name == "Punkt_1"
+        assert provider.get_point("nieznany") is None
+        provider.close()
+
+    def test_read_from_buffer(self):
+        """Provider reads a workbook from an in-memory buffer."""
+        buffer = io.BytesIO()
+        _build_workbook([]).save(buffer)
+
+        provider = ExcelProvider(io.BytesIO(buffer.getvalue()))
+        points = provider.list_points()
+        provider.close()
+
+        assert [p.id for p in points] == ["P1"]
+
+
+class TestListMeasurements:
+    """Tests for reading measurement sheets."""
+
+    def test_parameters_flags_and_units(self, workbook_path):
+        """Numeric values, flags and units are parsed from a row."""
+        rows = [
+            _measurement_row(
+                datetime(2024, 1, 15),
+                time(10, 30),
+                water_temperature=12.5,
+                pH="7,2",
+                nitrates="<0,05",
+            ),
+        ]
+        provider = ExcelProvider(workbook_path(_build_workbook(rows)))
+        measurements = provider.list_measurements("P1")
+        provider.close()
+
+        assert len(measurements) == 1
+        m = measurements[0]
+        assert m.point_id == "P1"
+        assert m.timestamp == datetime(2024, 1, 15, 10, 30)
+        assert m.parameters == {
+            "water_temperature": 12.5,
+            "nitrates": 0.05,
+            "pH": 7.2,
+        }
+        assert m.flags == {"nitrates": "<"}
+        assert m.units["water_temperature"] == "°C"
+        assert "transparency" not in m.units
+
+    def test_rows_without_date_are_skipped(self, workbook_path):
+        """Rows with an empty date cell do not produce measurements."""
+        rows = [
+            _measurement_row(datetime(2024, 1, 15), water_temperature=10.0),
+            _measurement_row(None, water_temperature=11.0),
+            _measurement_row(datetime(2024, 2, 15), water_temperature=12.0),
+        ]
+        provider = ExcelProvider(workbook_path(_build_workbook(rows)))
+        measurements = provider.list_measurements("P1")
+        provider.close()
+
+        assert [m.parameters["water_temperature"] for m in measurements] == [
+            10.0,
+            12.0,
+        ]
+
+    def test_rows_without_parameter_values_are_skipped(self, workbook_path):
+        """Rows with a date but no parameter values are skipped."""
+        stub = _measurement_row(datetime(2024, 2, 15))
+        stub[25] = "planowany pomiar"
+        rows = [
+            _measurement_row(datetime(2024, 1, 15), nitrates=1.5),
+            stub,
+        ]
+        provider = ExcelProvider(workbook_path(_build_workbook(rows)))
+        measurements = provider.list_measurements("P1")
+        provider.close()
+
+        assert [m.timestamp for m in measurements] == [datetime(2024, 1, 15)]
+
+    def test_missing_time_defaults_to_midnight(self, workbook_path):
+        """A row without sampling time gets a midnight timestamp."""
+        rows = [_measurement_row(datetime(2024, 3, 1), pH=7.0)]
+        provider = ExcelProvider(workbook_path(_build_workbook(rows)))
+        measurements = provider.list_measurements("P1")
+        provider.close()
+
+        assert measurements[0].timestamp == datetime(2024, 3, 1, 0, 0)
+
+    def test_cells_beyond_used_columns_are_ignored(self, workbook_path):
+        """Stray cells to the right of the used columns do not break parsing."""
+        row = _measurement_row(datetime(2024, 1, 15), pH=7.0)
+        row += [None] * 4 + ["przypis"]
+        provider = ExcelProvider(workbook_path(_build_workbook([row])))
+        measurements = provider.list_measurements("P1")
+        provider.close()
+
+        assert measurements[0].parameters == {"pH": 7.0}
+
+    def test_text_and_serial_dates(self, workbook_path):
+        """Dates and times stored as text or serial numbers are parsed."""
+        rows = [
+            _measurement_row("2024-04-01", "08:15", pH=7.0),
+            _measurement_row(45000, 0.5, pH=7.1),
+            _measurement_row("brak daty", None, pH=7.2),
+        ]
+        provider = ExcelProvider(workbook_path(_build_workbook(rows)))
+        measurements = provider.list_measurements("P1")
+        provider.close()
+
+        assert [m.timestamp for m in measurements] == [
+            datetime(2024, 4, 1, 8, 15),
+            datetime(2023, 3, 15, 12, 0),
+        ]
+
+    def test_measurements_are_cached_per_point(self, workbook_path):
+        """Measurements are served from cache once the workbook is closed."""
+        rows = [_measurement_row(datetime(2024, 1, 15), water_temperature=10.0)]
+        provider = ExcelProvider(workbook_path(_build_workbook(rows)))
+        first = provider.list_measurements("P1")
+        provider.close()
+
+        second = provider.list_measurements("P1")
+
+        assert second == first
+        assert provider._wb is None
+
+    def test_unknown_point_returns_empty_list(self, workbook_path):
+        """Unknown point id yields no measurements."""
+        provider = ExcelProvider(workbook_path(_build_workbook([])))
+        assert provider.list_measurements("nieznany") == []
+        provider.close()
+
+
+class TestWorkbookHandle:
+    """Tests for workbook handle lifetime."""
+
+    def test_workbook_opened_once(self, workbook_path):
+        """Points and all measurement sheets are read from one workbook."""
+        rows = [_measurement_row(datetime(2024, 1, 15), pH=7.0)]
+        path = workbook_path(_build_workbook(rows))
+
+        with patch(
+            "providers.excel.load_workbook", wraps=load_workbook
+        ) as mock_load:
+            provider = ExcelProvider(path)
+            provider.list_points()
+            provider.list_measurements("P1")
+            provider.close()
+
+        assert mock_load.call_count == 1
+
+    def test_context_manager_closes_workbook(self, workbook_path):
+        """Leaving the with block releases the workbook handle."""
+        path = workbook_path(_build_workbook([]))
+
+        with ExcelProvider(path) as provider:
+            provider.list_points()
+            assert provider._wb is not None
+
+        assert provider._wb is None
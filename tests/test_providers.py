@@ -80,6 +80,24 @@ class TestParseNumericValue:
         assert value == 0.05
         assert flag == "<"
 
+    def test_parse_flag_with_whitespace(self):
+        """Test parsing flag separated from the number by whitespace."""
+        value, flag = parse_numeric_value(" > 1,5 ")
+        assert value == 1.5
+        assert flag == ">"
+
+    def test_parse_leading_decimal_separator(self):
+        """Test parsing value without leading zero."""
+        value, flag = parse_numeric_value(",5")
+        assert value == 0.5
+        assert flag is None
+
+    def test_parse_malformed_number(self):
+        """Test parsing string with multiple decimal separators."""
+        value, flag = parse_numeric_value("1.2.3")
+        assert value is None
+        assert flag is None
+
 
 class TestParseCoordinates:
     """Tests for parse_coordinates function."""
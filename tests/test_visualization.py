@@ -1,103 +1,463 @@
 """Tests for visualization module."""
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from unittest.mock import patch
 
+import matplotlib.pyplot as plt
+import numpy as np
 import pytest
+from matplotlib.dates import date2num
 from matplotlib.figure import Figure
 
 from domain import Measurement
-from visualization import plot_water_quality
+from visualization import (
+    plot_chemical_parameters,
+    plot_water_quality,
+    render_all,
+    update_water_quality,
+)
+
+
+@pytest.fixture(scope="module")
+def base_measurements() -> list[Measurement]:
+    """Measurements of physicochemical parameters shared by tests."""
+    return [
+        Measurement(
+            point_id="P001",
+            timestamp=datetime(2024, 1, 15, 10, 0),
+            parameters={
+                "water_temperature": 10.0,
+                "pH": 7.0,
+                "dissolved_oxygen": 9.0,
+            },
+        ),
+        Measurement(
+            point_id="P001",
+            timestamp=datetime(2024, 2, 15, 10, 0),
+            parameters={
+                "water_temperature": 12.0,
+                "pH": 7.2,
+                "dissolved_oxygen": 8.5,
+            },
+        ),
+    ]
 
 
 class TestPlotWaterQuality:
     """Tests for plot_water_quality function."""
 
-    def test_plot_creates_figure(self):
-        """Test that plot_water_quality returns a Figure."""
+    @pytest.mark.parametrize("title", [None, "Test Title"])
+    def test_plot_creates_figure(self, base_measurements, title):
+        """Test that plot_water_quality returns a Figure with the title."""
+        fig = plot_water_quality(base_measurements, title=title)
+
+        assert isinstance(fig, Figure)
+        if title is None:
+            assert fig._suptitle is None
+        else:
+            assert fig._suptitle.get_text() == title
+
+    def test_plot_does_not_register_pyplot_figure(self, base_measurements):
+        """Test that figures are built outside pyplot's global state."""
+        before = plt.get_fignums()
+
+        plot_water_quality(base_measurements, title="Bez pyplot")
+
+        assert plt.get_fignums() == before
+
+    def test_plot_raises_on_empty_list(self):
+        """Test that plot_water_quality raises on empty list."""
+        with pytest.raises(ValueError, match="No measurements provided"):
+            plot_water_quality([])
+
+    def test_plot_with_missing_parameters(self):
+        """Test plotting with some missing parameters."""
         measurements = [
             Measurement(
                 point_id="P001",
                 timestamp=datetime(2024, 1, 15, 10, 0),
-                parameters={
-                    "water_temperature": 10.0,
-                    "pH": 7.0,
-                    "dissolved_oxygen": 9.0,
-                },
+                parameters={"water_temperature": 10.0},
             ),
             Measurement(
                 point_id="P001",
                 timestamp=datetime(2024, 2, 15, 10, 0),
-                parameters={
-                    "water_temperature": 12.0,
-                    "pH": 7.2,
-                    "dissolved_oxygen": 8.5,
-                },
+                parameters={"pH": 7.2},
             ),
         ]
 
         fig = plot_water_quality(measurements)
 
         assert isinstance(fig, Figure)
+        assert [ax.get_ylabel() for ax in fig.axes] == [
+            "Temperatura wody [°C]",
+            "pH",
+        ]
 
-    def test_plot_with_title(self):
-        """Test that plot_water_quality accepts custom title."""
+    def test_plot_sorts_by_timestamp(self):
+        """Test that measurements are sorted by timestamp."""
         measurements = [
+            Measurement(
+                point_id="P001",
+                timestamp=datetime(2024, 3, 15, 10, 0),
+                parameters={"water_temperature": 15.0},
+            ),
             Measurement(
                 point_id="P001",
                 timestamp=datetime(2024, 1, 15, 10, 0),
                 parameters={"water_temperature": 10.0},
             ),
+            Measurement(
+                point_id="P001",
+                timestamp=datetime(2024, 2, 15, 10, 0),
+                parameters={"water_temperature": 12.0},
+            ),
         ]
 
-        fig = plot_water_quality(measurements, title="Test Title")
+        fig = plot_water_quality(measurements)
 
         assert isinstance(fig, Figure)
-        assert fig._suptitle.get_text() == "Test Title"
+        assert list(fig.axes[0].lines[0].get_ydata()) == [10.0, 12.0, 15.0]
 
-    def test_plot_raises_on_empty_list(self):
-        """Test that plot_water_quality raises on empty list."""
-        with pytest.raises(ValueError, match="No measurements provided"):
-            plot_water_quality([])
+    def test_plot_reuses_given_figure(self, base_measurements):
+        """Test that a passed figure with the same series is updated in place."""
+        fig = plot_water_quality(base_measurements, title="Pierwszy")
+        n_axes = len(fig.axes)
+        line = fig.axes[0].lines[0]
 
-    def test_plot_with_missing_parameters(self):
-        """Test plotting with some missing parameters."""
+        result = plot_water_quality(base_measurements, title="Drugi", fig=fig)
+
+        assert result is fig
+        assert len(fig.axes) == n_axes
+        assert fig.axes[0].lines[0] is line
+        assert fig._suptitle.get_text() == "Drugi"
+
+    def test_plot_returns_independent_copy_for_same_data(self):
+        """Test that replotting the same data gives a separate figure."""
         measurements = [
+            Measurement(
+                point_id="P001",
+                timestamp=datetime(2024, 1, 15, 10, 0),
+                parameters={"water_temperature": 10.0, "pH": 7.0},
+            ),
+        ]
+        first = plot_water_quality(measurements, title="Kopia")
+        first.suptitle("Zmieniony")
+
+        second = plot_water_quality(measurements, title="Kopia")
+
+        assert second is not first
+        assert second._suptitle.get_text() == "Kopia"
+        assert len(second.axes) == len(first.axes)
+
+    def test_plot_updates_figure_with_same_series_in_place(self):
+        """Test that a figure with the same series keeps its artists."""
+        first = [
             Measurement(
                 point_id="P001",
                 timestamp=datetime(2024, 1, 15, 10, 0),
                 parameters={"water_temperature": 10.0},
             ),
+        ]
+        second = [
+            Measurement(
+                point_id="P002",
+                timestamp=datetime(2025, 6, 1, 10, 0),
+                parameters={"water_temperature": 20.0},
+            ),
+            Measurement(
+                point_id="P002",
+                timestamp=datetime(2025, 7, 1, 10, 0),
+                parameters={"water_temperature": 22.0},
+            ),
+        ]
+        fig = plot_water_quality(first)
+        line = fig.axes[0].lines[0]
+
+        plot_water_quality(second, fig=fig)
+
+        assert fig.axes[0].lines[0] is line
+        assert list(line.get_ydata()) == [20.0, 22.0]
+        assert fig.axes[0].get_xlim()[0] > date2num(datetime(2025, 1, 1))
+
+    def test_plot_rebuilds_figure_with_different_series(self):
+        """Test that a figure is redrawn when the plotted series differ."""
+        first = [
             Measurement(
                 point_id="P001",
-                timestamp=datetime(2024, 2, 15, 10, 0),
-                parameters={"pH": 7.2},
+                timestamp=datetime(2024, 1, 15, 10, 0),
+                parameters={"water_temperature": 10.0},
             ),
         ]
+        second = [
+            Measurement(
+                point_id="P002",
+                timestamp=datetime(2024, 1, 15, 10, 0),
+                parameters={"water_temperature": 10.0, "pH": 7.0},
+            ),
+        ]
+        fig = plot_water_quality(first)
 
-        fig = plot_water_quality(measurements)
+        plot_water_quality(second, fig=fig)
 
-        assert isinstance(fig, Figure)
+        assert sum(len(ax.lines) for ax in fig.axes) == 2
 
-    def test_plot_sorts_by_timestamp(self):
-        """Test that measurements are sorted by timestamp."""
+
+def _temperature_series(start_month: int, values: list[float]) -> list[Measurement]:
+    """Build monthly water temperature measurements."""
+    return [
+        Measurement(
+            point_id="P001",
+            timestamp=datetime(2024, start_month + i, 15, 10, 0),
+            parameters={"water_temperature": value},
+        )
+        for i, value in enumerate(values)
+    ]
+
+
+class TestUpdateWaterQuality:
+    """Tests for update_water_quality function."""
+
+    def test_update_within_date_range_keeps_axes_limits(self):
+        """Test that new data inside the date range is blitted in place."""
+        fig = plot_water_quality(_temperature_series(1, [10.0, 12.0, 14.0]))
+        update_water_quality(fig, _temperature_series(1, [10.0, 12.0, 14.0]))
+        xlim = fig.axes[0].get_xlim()
+        line = fig.axes[0].lines[0]
+
+        update_water_quality(fig, _temperature_series(2, [20.0, 21.0]))
+
+        assert fig.axes[0].lines[0] is line
+        assert list(line.get_ydata()) == [20.0, 21.0]
+        assert fig.axes[0].get_xlim() == xlim
+        assert not line.get_animated()
+
+    def test_update_outside_date_range_rescales(self):
+        """Test that data beyond the date range triggers a full redraw."""
+        fig = plot_water_quality(_temperature_series(1, [10.0, 12.0]))
+        update_water_quality(fig, _temperature_series(1, [10.0, 12.0]))
+        xmax = fig.axes[0].get_xlim()[1]
+
+        update_water_quality(fig, _temperature_series(1, [10.0, 12.0, 14.0, 16.0]))
+
+        assert fig.axes[0].get_xlim()[1] > xmax
+        assert list(fig.axes[0].lines[0].get_ydata()) == [10.0, 12.0, 14.0, 16.0]
+
+    def test_full_redraw_keeps_title_of_reused_figure(self):
+        """Test that a redraw uses the title of the latest plot, not the first."""
+        fig = plot_water_quality(_temperature_series(1, [10.0, 12.0]), title="Punkt A")
+        plot_water_quality(
+            _temperature_series(1, [11.0, 13.0]), title="Punkt B", fig=fig
+        )
+        update_water_quality(fig, _temperature_series(1, [11.0, 13.0]))
+
+        update_water_quality(fig, _temperature_series(1, [11.0, 13.0, 15.0, 17.0]))
+
+        assert fig._suptitle.get_text() == "Punkt B"
+
+    @pytest.mark.parametrize(
+        "replot",
+        [
+            pytest.param(
+                [
+                    Measurement(
+                        point_id="P001",
+                        timestamp=datetime(2024, month, 15, 10, 0),
+                        parameters={"water_temperature": 10.0, "pH": 7.0},
+                    )
+                    for month in (1, 2)
+                ],
+                id="series",
+            ),
+            pytest.param(_temperature_series(1, [10.0, 12.0]), id="title"),
+        ],
+    )
+    def test_update_after_replot_matches_full_draw(self, replot):
+        """Test that a replotted figure is not blitted over an old background."""
+        fig = plot_water_quality(_temperature_series(1, [10.0, 12.0]), title="A")
+        update_water_quality(fig, _temperature_series(1, [10.0, 12.0]))
+        plot_water_quality(replot, title="B", fig=fig)
+
+        update_water_quality(fig, replot)
+
+        blitted = np.asarray(fig.canvas.buffer_rgba()).copy()
+        fig.canvas.draw()
+        assert np.array_equal(blitted, np.asarray(fig.canvas.buffer_rgba()))
+
+    def test_update_rejects_other_figures(self):
+        """Test that only water quality figures can be updated."""
+        fig = plot_chemical_parameters(
+            [
+                Measurement(
+                    point_id="P001",
+                    timestamp=datetime(2024, 1, 15, 10, 0),
+                    parameters={"nitrates": 1.5},
+                ),
+            ]
+        )
+
+        with pytest.raises(ValueError, match="plot_water_quality"):
+            update_water_quality(fig, _temperature_series(1, [10.0]))
+
+
+class TestPlotChemicalParameters:
+    """Tests for plot_chemical_parameters function."""
+
+    def test_flagged_values_plotted_separately(self):
+        """Test that flagged values are drawn apart from regular ones."""
         measurements = [
+            Measurement(
+                point_id="P001",
+                timestamp=datetime(2024, 1, 15, 10, 0),
+                parameters={"nitrates": 1.5},
+            ),
+            Measurement(
+                point_id="P001",
+                timestamp=datetime(2024, 2, 15, 10, 0),
+                parameters={"nitrates": 0.05},
+                flags={"nitrates": "<"},
+            ),
             Measurement(
                 point_id="P001",
                 timestamp=datetime(2024, 3, 15, 10, 0),
-                parameters={"water_temperature": 15.0},
+                parameters={"nitrates": 2.0},
             ),
+        ]
+
+        fig = plot_chemical_parameters(measurements)
+
+        normal, flagged = fig.axes[0].collections
+        assert list(normal.get_offsets()[:, 1]) == [1.5, 2.0]
+        assert list(flagged.get_offsets()[:, 1]) == [0.05]
+
+    def test_flagged_values_share_one_collection(self):
+        """Test that flagged values of all parameters form one collection."""
+        measurements = [
             Measurement(
                 point_id="P001",
                 timestamp=datetime(2024, 1, 15, 10, 0),
-                parameters={"water_temperature": 10.0},
+                parameters={"nitrates": 0.05, "chlorides": 20.0},
+                flags={"nitrates": "<"},
             ),
             Measurement(
                 point_id="P001",
                 timestamp=datetime(2024, 2, 15, 10, 0),
-                parameters={"water_temperature": 12.0},
+                parameters={"nitrates": 1.5, "chlorides": 500.0},
+                flags={"chlorides": ">"},
             ),
         ]
 
-        fig = plot_water_quality(measurements)
+        fig = plot_chemical_parameters(measurements)
 
-        assert isinstance(fig, Figure)
+        collections = fig.axes[0].collections
+        assert len(collections) == 3
+        flagged = collections[-1]
+        assert list(flagged.get_offsets()[:, 1]) == [0.05, 500.0]
+        assert len(flagged.get_paths()) == 2
+
+    def test_flag_note_below_legend(self):
+        """Test that the note about flags does not overlap the legend."""
+        measurements = [
+            Measurement(
+                point_id="P001",
+                timestamp=datetime(2024, 1, 15, 10, 0),
+                parameters={"nitrates": 0.05, "chlorides": 20.0},
+                flags={"nitrates": "<"},
+            ),
+        ]
+
+        fig = plot_chemical_parameters(measurements)
+        fig.canvas.draw()
+
+        legend = fig.axes[0].get_legend().get_window_extent()
+        note = fig.texts[-1].get_window_extent()
+        assert note.y1 <= legend.y0
+
+    def test_regular_value_sharing_date_with_flagged_one_is_plotted(self):
+        """Test that flags are matched by row, not by timestamp."""
+        timestamp = datetime(2024, 1, 15, 10, 0)
+        measurements = [
+            Measurement(
+                point_id="P001",
+                timestamp=timestamp,
+                parameters={"nitrates": 0.05},
+                flags={"nitrates": "<"},
+            ),
+            Measurement(
+                point_id="P001",
+                timestamp=timestamp,
+                parameters={"nitrates": 1.5},
+            ),
+        ]
+
+        fig = plot_chemical_parameters(measurements)
+
+        normal, flagged = fig.axes[0].collections
+        assert list(normal.get_offsets()[:, 1]) == [1.5]
+        assert list(flagged.get_offsets()[:, 1]) == [0.05]
+
+    def test_reused_figure_keeps_y_label_inside(self):
+        """Test that a reused figure is laid out again for wider tick labels."""
+
+        def chlorides(values: list[float]) -> list[Measurement]:
+            return [
+                Measurement(
+                    point_id="P001",
+                    timestamp=datetime(2024, month, 15, 10, 0),
+                    parameters={"chlorides": value},
+                )
+                for month, value in enumerate(values, start=1)
+            ]
+
+        fig = plot_chemical_parameters(chlorides([2.0, 4.0, 8.0]))
+        line_collection = fig.axes[0].collections[0]
+
+        plot_chemical_parameters(chlorides([20.0, 1500.0, 800.0]), fig=fig)
+
+        assert fig.axes[0].collections[0] is line_collection
+        fig.canvas.draw()
+        label = fig.axes[0].yaxis.label.get_window_extent()
+        assert label.x0 >= 0
+
+
+class TestRenderAll:
+    """Tests for render_all function."""
+
+    SPECS = [("water_quality", "Parametry"), ("chemical", None)]
+
+    def test_renders_in_process_by_default(self, base_measurements):
+        """Test that no worker processes are started unless requested."""
+        with patch("visualization.plots.ProcessPoolExecutor") as pool:
+            images = render_all(base_measurements, self.SPECS, dpi=50)
+
+        pool.assert_not_called()
+        assert all(png.startswith(b"\x89PNG") for png in images)
+
+    def test_worker_pool_matches_serial_rendering(self, base_measurements):
+        """Test that workers get measurements once and render the same images."""
+
+        # Threads stand in for processes to keep the suite fast
+        def thread_pool(max_workers, mp_context, initializer, initargs):
+            return ThreadPoolExecutor(
+                max_workers, initializer=initializer, initargs=initargs
+            )
+
+        with (
+            patch(
+                "visualization.plots.ProcessPoolExecutor", side_effect=thread_pool
+            ) as pool,
+            patch("visualization.plots._worker_measurements", ()),
+            patch("visualization.plots._plot_cache", OrderedDict()) as cache,
+        ):
+            parallel = render_all(base_measurements, self.SPECS, dpi=50, max_workers=2)
+            serial = render_all(base_measurements, self.SPECS, dpi=50)
+
+        assert pool.call_args.kwargs["initargs"] == (tuple(base_measurements),)
+        assert not cache
+        assert parallel == serial
+
+    def test_unknown_kind_raises(self, base_measurements):
+        """Test that unknown plot kinds are rejected before rendering."""
+        with pytest.raises(ValueError, match="histogram"):
+            render_all(base_measurements, [("histogram", None)])
@@ -1,5 +1,15 @@
 """Visualization module for water quality monitoring system."""
 
-from visualization.plots import plot_chemical_parameters, plot_water_quality
+from visualization.plots import (
+    plot_chemical_parameters,
+    plot_water_quality,
+    render_all,
+    update_water_quality,
+)
 
-__all__ = ["plot_water_quality", "plot_chemical_parameters"]
+__all__ = [
+    "plot_water_quality",
+    "plot_chemical_parameters",
+    "update_water_quality",
+    "render_all",
+]
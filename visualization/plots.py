@@ -1,52 +1,292 @@
 """Visualization utilities for water quality measurement data."""
 
+import hashlib
+import io
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from multiprocessing import get_all_start_methods, get_context
+from operator import attrgetter, le
 from typing import Sequence
 
-import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
+from matplotlib.markers import MarkerStyle
+from matplotlib.path import Path
 
 from domain import Measurement
 
+_by_timestamp = attrgetter("timestamp")
+
+# Water quality series: (parameter, color, label, y axis limits)
+_WQ_PARAMS = (
+    ("water_temperature", "tab:blue", "Temperatura wody [°C]", (0, 30)),
+    ("pH", "tab:orange", "pH", (5, 9)),
+    ("dissolved_oxygen", "darkgreen", "Tlen rozpuszczony [mg/L]", (0, 15)),
+    ("conductivity", "tab:purple", "Przewodność [µS/cm]", (0, 3500)),
+)
+_WQ_NAMES = tuple(param[0] for param in _WQ_PARAMS)
+
+# Chemical series: (parameter, color, label, marker)
+_CHEM_PARAMS = (
+    ("nitrates", "tab:blue", "Azotany [mg/L]", "o"),
+    ("nitrites", "tab:orange", "Azotyny [mg/L]", "s"),
+    ("phosphates", "tab:green", "Fosforany [mg/L]", "^"),
+    ("chlorides", "tab:red", "Chlorki [mg/L]", "d"),
+    ("sulphates", "tab:purple", "Siarczany [mg/L]", "v"),
+)
+_CHEM_NAMES = tuple(param[0] for param in _CHEM_PARAMS)
+
+# Integer codes of range flags; unknown flag strings are not plotted as flagged
+_FLAG_CODES = {"<": 1, ">": 2}
+
+# Number of figures kept for repeated plots of the same data
+_PLOT_CACHE_SIZE = 32
+_plot_cache: OrderedDict[bytes, bytes] = OrderedDict()
+_plot_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class _ParamColumns:
+    """
+    Measurement data of several parameters as column arrays.
+
+    Attributes
+    ----------
+    x : np.ndarray
+        Timestamps as Matplotlib date numbers, shape (N,).
+    values : np.ndarray
+        Values with NaN where missing, shape (P, N).
+    flagged : np.ndarray
+        Mask of values with '<' or '>' flags, shape (P, N).
+    normal : np.ndarray
+        Mask of present values without flags, shape (P, N).
+    has_data : np.ndarray
+        Whether each parameter has any value, shape (P,).
+    has_flags : np.ndarray
+        Whether each parameter has any flagged value, shape (P,).
+    """
 
-def _has_valid_data(values: list) -> bool:
-    """Check if list contains any non-None values."""
-    return any(v is not None for v in values)
+    x: np.ndarray
+    values: np.ndarray
+    flagged: np.ndarray
+    normal: np.ndarray
+    has_data: np.ndarray
+    has_flags: np.ndarray
 
 
-def _extract_param_data(
+def _sorted_by_time(
     measurements: Sequence[Measurement],
-    param_name: str,
-) -> tuple[list, list, list, list, list]:
+) -> Sequence[Measurement]:
     """
-    Extract parameter data separating flagged and non-flagged values.
+    Return measurements ordered by timestamp.
 
-    Returns
-    -------
-    tuple
-        (all_dates, all_values, flagged_dates, flagged_values, has_flags)
+    Measurements already in order (as read from a sheet) are returned
+    as is, so plotting the same list twice does not sort it twice.
     """
-    all_dates = []
-    all_values = []
-    flagged_dates = []
-    flagged_values = []
+    timestamps = list(map(_by_timestamp, measurements))
+    if all(map(le, timestamps, timestamps[1:])):
+        return measurements
+    return sorted(measurements, key=_by_timestamp)
+
+
+def _prepare_figure(fig: Figure | None) -> tuple[Figure, Axes]:
+    """
+    Return a figure with a single axes, clearing a reused figure.
+
+    The x axis of the axes expects Matplotlib date numbers.
+    """
+    if fig is None:
+        # Built without pyplot, so figures are not tracked globally and
+        # need no plt.close(); they are freed like any other object
+        fig = Figure(figsize=(14, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+    else:
+        fig.clear()
+        fig._smw_artists = None
+        # A background saved for blitting shows the previous plot
+        fig.canvas._smw_background = None
+        ax = fig.subplots()
+    ax.xaxis_date()
+    return fig, ax
+
+
+def _stack_left_axis(ax: Axes, offset: float) -> None:
+    """Move the y axis of a twin axes to the left, shifted outward."""
+    ax.spines["left"].set_position(("outward", offset))
+    ax.spines["right"].set_visible(False)
+    ax.yaxis.set_label_position("left")
+    ax.yaxis.tick_left()
+
+
+def _format_date_axis(ax: Axes) -> None:
+    """Rotate date labels on the x axis so they do not overlap."""
+    ax.tick_params(axis="x", labelrotation=30)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+
+
+def _marker_path(marker: str) -> Path:
+    """Return the path scatter() draws for the given marker."""
+    style = MarkerStyle(marker)
+    return style.get_path().transformed(style.get_transform())
+
+
+def _layout_key(kind: str, title: str | None, data: _ParamColumns) -> tuple:
+    """Describe which artists a plot of the given data consists of."""
+    return (
+        kind,
+        bool(title),
+        tuple(np.flatnonzero(data.has_data).tolist()),
+        tuple(np.flatnonzero(data.has_flags).tolist()),
+    )
+
+
+def _fingerprint(kind: str, title: str | None, data: _ParamColumns) -> bytes:
+    """Return a digest identifying a plot of the given data."""
+    digest = hashlib.blake2b(repr((kind, title)).encode(), digest_size=16)
+    for array in (data.x, data.values, data.flagged):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.digest()
+
+
+def _cached_figure(key: bytes) -> Figure | None:
+    """Return a copy of a cached figure, or None if it is not cached."""
+    with _plot_cache_lock:
+        blob = _plot_cache.get(key)
+        if blob is None:
+            return None
+        _plot_cache.move_to_end(key)
+    fig = pickle.loads(blob)
+    FigureCanvasAgg(fig)
+    return fig
 
-    for m in measurements:
-        value = m.parameters.get(param_name)
-        all_dates.append(m.timestamp)
-        all_values.append(value)
 
-        flag = m.flags.get(param_name)
-        if flag in ("<", ">") and value is not None:
-            flagged_dates.append(m.timestamp)
-            flagged_values.append(value)
+def _cache_figure(key: bytes, fig: Figure) -> None:
+    """Store a copy of a figure, evicting the least recently used one."""
+    blob = pickle.dumps(fig)
+    with _plot_cache_lock:
+        _plot_cache[key] = blob
+        _plot_cache.move_to_end(key)
+        while len(_plot_cache) > _PLOT_CACHE_SIZE:
+            _plot_cache.popitem(last=False)
+
+
+def _reusable_artists(fig: Figure | None, key: tuple) -> dict | None:
+    """Return artists of a figure drawn earlier with the same layout."""
+    artists = getattr(fig, "_smw_artists", None)
+    if artists is None or artists["key"] != key:
+        return None
+    return artists
+
+
+def _set_artist_data(artists: dict, data: _ParamColumns) -> None:
+    """Replace data of stored artists in place."""
+    x = data.x
+    values = data.values
+
+    for j, line in artists["lines"].items():
+        line.set_data(x, values[j])
+    for j, points in artists["normal"].items():
+        normal = data.normal[j]
+        points.set_offsets(np.column_stack([x[normal], values[j, normal]]))
+    for j, points in artists["flagged"].items():
+        flagged = data.flagged[j]
+        points.set_offsets(np.column_stack([x[flagged], values[j, flagged]]))
+    if artists["flag_layer"] is not None:
+        points, colors, paths = artists["flag_layer"]
+        rows, cols = np.nonzero(data.flagged)
+        points.set_offsets(np.column_stack([x[cols], values[rows, cols]]))
+        points.set_paths([paths[j] for j in rows])
+        points.set_facecolor([colors[j] for j in rows])
+
+
+def _data_artists(artists: dict) -> list:
+    """Return all stored artists that show measurement data."""
+    result = [
+        *artists["lines"].values(),
+        *artists["normal"].values(),
+        *artists["flagged"].values(),
+    ]
+    if artists["flag_layer"] is not None:
+        result.append(artists["flag_layer"][0])
+    return result
+
+
+def _update_artists(
+    fig: Figure,
+    artists: dict,
+    data: _ParamColumns,
+    title: str | None,
+) -> None:
+    """Replace data of stored artists in place, rescale and lay out again."""
+    _set_artist_data(artists, data)
+    artists["title"] = title
+    fig.canvas._smw_background = None
 
-    has_flags = len(flagged_values) > 0
-    return all_dates, all_values, flagged_dates, flagged_values, has_flags
+    if title:
+        fig.suptitle(title, fontsize=14, fontweight="bold")
+
+    for ax in fig.axes:
+        ax.relim()
+        # Older matplotlib versions skip collections in relim()
+        for collection in ax.collections:
+            ax.update_datalim(collection.get_offsets())
+        ax.autoscale_view()
+
+    # New limits may need wider tick labels than the previous data
+    fig.tight_layout(rect=(0, 0.05, 1, 1) if data.has_flags.any() else None)
+
+
+def _extract_all(
+    measurements: Sequence[Measurement],
+    param_names: Sequence[str],
+) -> _ParamColumns:
+    """Extract data of all parameters in a single pass over measurements."""
+    column = {name: j for j, name in enumerate(param_names)}
+    dates = []
+    rows = []
+    flag_cells = []
+
+    for i, m in enumerate(measurements):
+        parameters = m.parameters
+        dates.append(m.timestamp)
+        rows.append([parameters.get(name) for name in param_names])
+        # Providers only store flags of flagged values, so this visits few cells
+        for name, flag in m.flags.items():
+            j = column.get(name)
+            code = _FLAG_CODES.get(flag, 0)
+            if j is not None and code:
+                flag_cells.append((j, i, code))
+
+    values = np.array(rows, dtype=float).T
+    present = ~np.isnan(values)
+    codes = np.zeros(values.shape, dtype=np.int8)
+    if flag_cells:
+        param_idx, meas_idx, cell_codes = np.array(flag_cells).T
+        codes[param_idx, meas_idx] = cell_codes
+    flagged = (codes != 0) & present
+    return _ParamColumns(
+        x=mdates.date2num(np.array(dates, dtype="datetime64[us]")),
+        values=values,
+        flagged=flagged,
+        normal=present & ~flagged,
+        has_data=present.any(axis=1),
+        has_flags=flagged.any(axis=1),
+    )
 
 
 def plot_water_quality(
     measurements: Sequence[Measurement],
     title: str | None = None,
+    fig: Figure | None = None,
 ) -> Figure:
     """
     Plot time series of water quality parameters.
@@ -58,6 +298,8 @@ def plot_water_quality(
     - conductivity (µS/cm, range 0-3500)
 
     Values with '<' or '>' flags are marked with black-edged markers.
+    Figures created without ``fig`` are cached; plotting the same data
+    and title again returns a copy of the cached figure.
 
     Parameters
     ----------
@@ -65,6 +307,11 @@ def plot_water_quality(
         Collection of measurements to plot.
     title : str, optional
         Custom title for the plot.
+    fig : Figure, optional
+        Existing figure to draw on, e.g. to reuse one figure for many
+        plots. If it was drawn by this function with the same series,
+        its artists are updated in place; otherwise it is cleared first.
+        A new figure is created if omitted.
 
     Returns
     -------
@@ -79,91 +326,66 @@ def plot_water_quality(
     if not measurements:
         raise ValueError("No measurements provided for plotting.")
 
-    measurements = sorted(measurements, key=lambda m: m.timestamp)
-
-    # Extract data for each parameter
-    params_config = {
-        "water_temperature": {"color": "tab:blue", "label": "Temperatura wody [°C]"},
-        "pH": {"color": "tab:orange", "label": "pH"},
-        "dissolved_oxygen": {"color": "darkgreen", "label": "Tlen rozpuszczony [mg/L]"},
-        "conductivity": {"color": "tab:purple", "label": "Przewodność [µS/cm]"},
-    }
-
-    param_data = {}
-    any_flags = False
-    for param in params_config:
-        data = _extract_param_data(measurements, param)
-        param_data[param] = data
-        if data[4]:  # has_flags
-            any_flags = True
-
-    fig, ax_temp = plt.subplots(figsize=(14, 6))
-    ax_ph = ax_temp.twinx()
-    ax_oxy = ax_temp.twinx()
-    ax_cond = ax_temp.twinx()
-
-    axes = {
-        "water_temperature": ax_temp,
-        "pH": ax_ph,
-        "dissolved_oxygen": ax_oxy,
-        "conductivity": ax_cond,
-    }
+    measurements = _sorted_by_time(measurements)
 
-    limits = {
-        "water_temperature": (0, 30),
-        "pH": (5, 9),
-        "dissolved_oxygen": (0, 15),
-        "conductivity": (0, 3500),
-    }
+    data = _extract_all(measurements, _WQ_NAMES)
+    x = data.x
+    any_flags = bool(data.has_flags.any())
 
-    # Position all Y-axes on the left side
-    ax_ph.spines["left"].set_position(("outward", 60))
-    ax_oxy.spines["left"].set_position(("outward", 120))
-    ax_cond.spines["left"].set_position(("outward", 180))
+    key = _layout_key("water_quality", title, data)
+    cache_key = None
+    if fig is None:
+        cache_key = _fingerprint("water_quality", title, data)
+        cached = _cached_figure(cache_key)
+        if cached is not None:
+            return cached
 
-    ax_ph.spines["right"].set_visible(False)
-    ax_oxy.spines["right"].set_visible(False)
-    ax_cond.spines["right"].set_visible(False)
-
-    ax_ph.yaxis.set_label_position("left")
-    ax_oxy.yaxis.set_label_position("left")
-    ax_cond.yaxis.set_label_position("left")
-
-    ax_ph.yaxis.tick_left()
-    ax_oxy.yaxis.tick_left()
-    ax_cond.yaxis.tick_left()
+    artists = _reusable_artists(fig, key)
+    if artists is not None:
+        _update_artists(fig, artists, data, title)
+        return fig
 
+    fig, host = _prepare_figure(fig)
     handles = []
-
-    # Plot lines and flagged markers
-    for param, config in params_config.items():
-        dates, values, flag_dates, flag_values, has_flags = param_data[param]
-        ax = axes[param]
-
-        if _has_valid_data(values):
-            line, = ax.plot(
-                dates,
-                values,
-                color=config["color"],
-                label=config["label"],
+    lines = {}
+    flag_points = {}
+
+    # Only parameters with data get an axis: the first one uses the host
+    # axes, the others twin axes stacked outward on the left side
+    for position, j in enumerate(np.flatnonzero(data.has_data).tolist()):
+        _, color, label, limits = _WQ_PARAMS[j]
+        if position == 0:
+            ax = host
+        else:
+            ax = host.twinx()
+            _stack_left_axis(ax, 60 * position)
+
+        values = data.values[j]
+        line, = ax.plot(
+            x,
+            values,
+            color=color,
+            label=label,
+        )
+        handles.append(line)
+        lines[j] = line
+        ax.set_ylabel(label, color=color)
+        ax.tick_params(axis="y", colors=color)
+
+        # Mark flagged values with black-edged markers
+        if data.has_flags[j]:
+            flagged = data.flagged[j]
+            flag_points[j] = ax.scatter(
+                x[flagged],
+                values[flagged],
+                color=color,
+                edgecolors="black",
+                linewidths=1.5,
+                s=60,
+                zorder=5,
             )
-            handles.append(line)
-            ax.set_ylabel(config["label"], color=config["color"])
-            ax.tick_params(axis="y", colors=config["color"])
-
-            # Mark flagged values with black-edged markers
-            if has_flags:
-                ax.scatter(
-                    flag_dates,
-                    flag_values,
-                    color=config["color"],
-                    edgecolors="black",
-                    linewidths=1.5,
-                    s=60,
-                    zorder=5,
-                )
-
-        ax.set_ylim(limits[param])
+
+        ax.set_ylim(limits)
 
     # Title
     if title:
@@ -171,7 +393,7 @@ def plot_water_quality(
 
     # Legend below the plot
     if handles:
-        ax_temp.legend(
+        host.legend(
             handles=handles,
             loc="upper center",
             bbox_to_anchor=(0.5, -0.15),
@@ -179,11 +401,12 @@ def plot_water_quality(
             frameon=False,
         )
 
-    ax_temp.grid(True, linestyle="--", alpha=0.4)
-    fig.autofmt_xdate()
-    fig.tight_layout()
+    host.grid(True, linestyle="--", alpha=0.4)
+    _format_date_axis(host)
+
+    # Lay out once, keeping a strip at the bottom for the flag note
+    fig.tight_layout(rect=(0, 0.05, 1, 1) if any_flags else None)
 
-    # Add note about flagged values (after tight_layout)
     if any_flags:
         fig.text(
             0.5, 0.02,
@@ -193,14 +416,24 @@ def plot_water_quality(
             style="italic",
             transform=fig.transFigure,
         )
-        fig.subplots_adjust(bottom=0.18)
 
+    fig._smw_artists = {
+        "key": key,
+        "title": title,
+        "lines": lines,
+        "normal": {},
+        "flagged": flag_points,
+        "flag_layer": None,
+    }
+    if cache_key is not None:
+        _cache_figure(cache_key, fig)
     return fig
 
 
 def plot_chemical_parameters(
     measurements: Sequence[Measurement],
     title: str | None = None,
+    fig: Figure | None = None,
 ) -> Figure:
     """
     Plot scatter chart of chemical parameters.
@@ -214,6 +447,8 @@ def plot_chemical_parameters(
 
     Only parameters with data are shown in the legend.
     Values with '<' or '>' flags are marked with black-edged markers.
+    Figures created without ``fig`` are cached; plotting the same data
+    and title again returns a copy of the cached figure.
 
     Parameters
     ----------
@@ -221,6 +456,11 @@ def plot_chemical_parameters(
         Collection of measurements to plot.
     title : str, optional
         Custom title for the plot.
+    fig : Figure, optional
+        Existing figure to draw on, e.g. to reuse one figure for many
+        plots. If it was drawn by this function with the same series,
+        its artists are updated in place; otherwise it is cleared first.
+        A new figure is created if omitted.
 
     Returns
     -------
@@ -235,65 +475,67 @@ def plot_chemical_parameters(
     if not measurements:
         raise ValueError("No measurements provided for plotting.")
 
-    measurements = sorted(measurements, key=lambda m: m.timestamp)
-
-    param_config = {
-        "nitrates": {"label": "Azotany [mg/L]", "color": "tab:blue", "marker": "o"},
-        "nitrites": {"label": "Azotyny [mg/L]", "color": "tab:orange", "marker": "s"},
-        "phosphates": {"label": "Fosforany [mg/L]", "color": "tab:green", "marker": "^"},
-        "chlorides": {"label": "Chlorki [mg/L]", "color": "tab:red", "marker": "d"},
-        "sulphates": {"label": "Siarczany [mg/L]", "color": "tab:purple", "marker": "v"},
-    }
+    measurements = _sorted_by_time(measurements)
 
     # Extract data with flag information
-    param_data = {}
-    any_flags = False
-    for param in param_config:
-        data = _extract_param_data(measurements, param)
-        param_data[param] = data
-        if data[4]:  # has_flags
-            any_flags = True
-
-    fig, ax = plt.subplots(figsize=(14, 6))
+    data = _extract_all(measurements, _CHEM_NAMES)
+    x = data.x
+    any_flags = bool(data.has_flags.any())
+
+    key = _layout_key("chemical", title, data)
+    cache_key = None
+    if fig is None:
+        cache_key = _fingerprint("chemical", title, data)
+        cached = _cached_figure(cache_key)
+        if cached is not None:
+            return cached
+
+    artists = _reusable_artists(fig, key)
+    if artists is not None:
+        _update_artists(fig, artists, data, title)
+        return fig
+
+    fig, ax = _prepare_figure(fig)
     handles = []
+    normal_points = {}
+    flag_layer = None
 
-    for param, config in param_config.items():
-        dates, values, flag_dates, flag_values, has_flags = param_data[param]
-
-        if _has_valid_data(values):
-            # Separate flagged and non-flagged points
-            normal_dates = []
-            normal_values = []
-            for i, (d, v) in enumerate(zip(dates, values)):
-                if v is not None and d not in flag_dates:
-                    normal_dates.append(d)
-                    normal_values.append(v)
+    for j, (_, color, label, marker) in enumerate(_CHEM_PARAMS):
+        if data.has_data[j]:
+            values = data.values[j]
+            normal = data.normal[j]
 
             # Plot non-flagged points
             scatter = ax.scatter(
-                normal_dates,
-                normal_values,
-                c=config["color"],
-                marker=config["marker"],
-                label=config["label"],
+                x[normal],
+                values[normal],
+                c=color,
+                marker=marker,
+                label=label,
                 s=50,
                 alpha=0.7,
             )
             handles.append(scatter)
+            normal_points[j] = scatter
 
-            # Plot flagged points with black edge
-            if has_flags:
-                ax.scatter(
-                    flag_dates,
-                    flag_values,
-                    c=config["color"],
-                    marker=config["marker"],
-                    s=70,
-                    alpha=0.9,
-                    edgecolors="black",
-                    linewidths=1.5,
-                    zorder=5,
-                )
+    # Plot flagged points of all parameters as one collection with black
+    # edges, each point keeping the color and marker of its parameter
+    if any_flags:
+        colors = [param[1] for param in _CHEM_PARAMS]
+        paths = [_marker_path(param[3]) for param in _CHEM_PARAMS]
+        rows, cols = np.nonzero(data.flagged)
+        flagged = ax.scatter(
+            x[cols],
+            data.values[rows, cols],
+            c=[colors[j] for j in rows],
+            s=70,
+            alpha=0.9,
+            edgecolors="black",
+            linewidths=1.5,
+            zorder=5,
+        )
+        flagged.set_paths([paths[j] for j in rows])
+        flag_layer = (flagged, colors, paths)
 
     ax.set_ylabel("Stężenie [mg/L]")
     ax.set_xlabel("Data")
@@ -311,10 +553,11 @@ def plot_chemical_parameters(
         )
 
     ax.grid(True, linestyle="--", alpha=0.4)
-    fig.autofmt_xdate()
-    fig.tight_layout()
+    _format_date_axis(ax)
+
+    # Lay out once, keeping a strip at the bottom for the flag note
+    fig.tight_layout(rect=(0, 0.05, 1, 1) if any_flags else None)
 
-    # Add note about flagged values (after tight_layout)
     if any_flags:
         fig.text(
             0.5, 0.02,
@@ -324,6 +567,207 @@ def plot_chemical_parameters(
             style="italic",
             transform=fig.transFigure,
         )
-        fig.subplots_adjust(bottom=0.18)
 
+    fig._smw_artists = {
+        "key": key,
+        "title": title,
+        "lines": {},
+        "normal": normal_points,
+        "flagged": {},
+        "flag_layer": flag_layer,
+    }
+    if cache_key is not None:
+        _cache_figure(cache_key, fig)
+    return fig
+
+
+def _draw_for_blit(fig: Figure) -> None:
+    """
+    Draw the figure fully and keep its static parts for blitting.
+
+    The background is stored on the canvas, which is not pickled with
+    the figure.
+    """
+    canvas = fig.canvas
+    dynamic = _data_artists(fig._smw_artists)
+
+    for artist in dynamic:
+        artist.set_animated(True)
+    canvas.draw()
+    canvas._smw_background = (
+        canvas.copy_from_bbox(fig.bbox),
+        fig.bbox.bounds,
+        fig.axes[0].get_xlim(),
+    )
+
+    # Animated artists are skipped by savefig, so only blit them once
+    for artist in dynamic:
+        artist.set_animated(False)
+        artist.axes.draw_artist(artist)
+    canvas.blit(fig.bbox)
+
+
+def update_water_quality(
+    fig: Figure,
+    measurements: Sequence[Measurement],
+) -> Figure:
+    """
+    Show new measurements on a water quality plot using blitting.
+
+    Only the lines and markers are redrawn, on top of a saved image of
+    the static parts of the figure (axes, ticks, labels, legend). The
+    figure is redrawn fully when the series change, when the new data
+    does not fit the current date range or when the canvas does not
+    support blitting.
+
+    Parameters
+    ----------
+    fig : Figure
+        Figure returned by ``plot_water_quality``.
+    measurements : Sequence[Measurement]
+        Collection of measurements to show.
+
+    Returns
+    -------
+    Figure
+        The updated figure.
+
+    Raises
+    ------
+    ValueError
+        If no measurements are provided or the figure was not created
+        by ``plot_water_quality``.
+    """
+    if not measurements:
+        raise ValueError("No measurements provided for plotting.")
+
+    artists = getattr(fig, "_smw_artists", None)
+    if artists is None or artists["key"][0] != "water_quality":
+        raise ValueError("Figure was not created by plot_water_quality.")
+
+    canvas = fig.canvas
+    if not canvas.supports_blit:
+        plot_water_quality(measurements, title=artists["title"], fig=fig)
+        canvas.draw_idle()
+        return fig
+
+    measurements = _sorted_by_time(measurements)
+    data = _extract_all(measurements, _WQ_NAMES)
+    xmin, xmax = fig.axes[0].get_xlim()
+    background = getattr(canvas, "_smw_background", None)
+
+    if (
+        background is None
+        or background[1:] != (fig.bbox.bounds, (xmin, xmax))
+        or _layout_key("water_quality", artists["title"], data) != artists["key"]
+        or data.x[0] < xmin
+        or data.x[-1] > xmax
+    ):
+        plot_water_quality(measurements, title=artists["title"], fig=fig)
+        _draw_for_blit(fig)
+        return fig
+
+    _set_artist_data(artists, data)
+    canvas.restore_region(background[0])
+    for artist in _data_artists(artists):
+        artist.axes.draw_artist(artist)
+    canvas.blit(fig.bbox)
     return fig
+
+
+_PLOTTERS = {
+    "water_quality": plot_water_quality,
+    "chemical": plot_chemical_parameters,
+}
+
+# Measurements of the current render_all call, set once per worker process
+_worker_measurements: tuple[Measurement, ...] = ()
+
+
+def _render_png(
+    measurements: Sequence[Measurement],
+    kind: str,
+    title: str | None,
+    dpi: float,
+) -> bytes:
+    """Build one figure and return it as PNG bytes."""
+    # Drawing on a given figure skips the plot cache, whose entries
+    # would never be read for one-shot images
+    fig = Figure(figsize=(14, 6))
+    FigureCanvasAgg(fig)
+    _PLOTTERS[kind](measurements, title=title, fig=fig)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi)
+    return buffer.getvalue()
+
+
+def _init_render_worker(measurements: tuple[Measurement, ...]) -> None:
+    """Store measurements in a worker process (process pool initializer)."""
+    global _worker_measurements
+    _worker_measurements = measurements
+
+
+def _render_in_worker(kind: str, title: str | None, dpi: float) -> bytes:
+    """Render one plot of the measurements stored in a worker process."""
+    return _render_png(_worker_measurements, kind, title, dpi)
+
+
+def render_all(
+    measurements: Sequence[Measurement],
+    specs: Sequence[tuple[str, str | None]],
+    dpi: float = 100,
+    max_workers: int | None = None,
+) -> list[bytes]:
+    """
+    Render several plots of the same measurements as PNG images.
+
+    Plots are rendered in this process unless ``max_workers`` asks for
+    worker processes, which bypass the GIL. Starting them takes about
+    a second, so they only pay off for heavy figures on several cores.
+
+    Parameters
+    ----------
+    measurements : Sequence[Measurement]
+        Collection of measurements to plot.
+    specs : Sequence[tuple[str, str | None]]
+        Plots to render as ``(kind, title)`` pairs, where kind is
+        ``"water_quality"`` or ``"chemical"``.
+    dpi : float, optional
+        Resolution of the images.
+    max_workers : int | None, optional
+        Maximum number of worker processes. Measurements are sent to
+        each worker once. By default the plots are rendered serially.
+
+    Returns
+    -------
+    list[bytes]
+        PNG images in the order of ``specs``.
+
+    Raises
+    ------
+    ValueError
+        If no measurements are provided or a plot kind is unknown.
+    """
+    if not measurements:
+        raise ValueError("No measurements provided for plotting.")
+    for kind, _ in specs:
+        if kind not in _PLOTTERS:
+            raise ValueError(f"Unknown plot kind: {kind!r}.")
+
+    kinds = [kind for kind, _ in specs]
+    titles = [title for _, title in specs]
+    workers = min(len(specs), max_workers or 1)
+
+    if workers < 2:
+        return list(map(_render_png, repeat(measurements), kinds, titles, repeat(dpi)))
+
+    # Forking a multi-threaded process (e.g. the Streamlit server) can
+    # deadlock the child, so workers are started from a clean process
+    method = "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+    with ProcessPoolExecutor(
+        workers,
+        mp_context=get_context(method),
+        initializer=_init_render_worker,
+        initargs=(tuple(measurements),),
+    ) as pool:
+        return list(pool.map(_render_in_worker, kinds, titles, repeat(dpi)))